@@ -32,12 +32,19 @@ Usage Examples:
    python3 actions.py --action apply_common_params
    (Optionally add --reboot_after to reboot the flight controller right after)
 
+7) Keep MAVSDK connected in a long-running daemon. While it runs, every other
+   invocation forwards its arguments to it over a Unix socket instead of
+   starting its own mavsdk_server:
+   python3 actions.py --daemon
+
 Description:
 ------------
 This script executes various drone actions using MAVSDK:
  - takeoff, land, hold, test, reboot, kill_terminate, update_code,
    return_rtl, init_sysid, apply_common_params, etc.
  - Safely manages MAVSDK server launch/teardown.
+ - Optionally runs as a persistent daemon (--daemon) so repeated actions reuse
+   one MAVSDK connection.
  - Provides logging, exit codes, LED status feedback, and robust error handling.
  - Supports setting multiple PX4 parameters in a single run via repeated --param.
  - Supports automatically setting MAV_SYS_ID based on a local .hwID file with 'init_sysid'.
@@ -49,14 +56,20 @@ This script executes various drone actions using MAVSDK:
 
 import argparse
 import asyncio
-import csv
-import glob
+import atexit
+import codecs
+import functools
+import json
 import logging
 import logging.handlers
+import math
 import os
+import queue
+import shutil
+import signal
 import socket
-import subprocess
 import sys
+import threading
 import time
 
 import psutil
@@ -65,6 +78,11 @@ from mavsdk.action import ActionError
 from src.led_controller import LEDController
 from src.params import Params
 
+try:
+    import uvloop  # Optional: faster libuv-based event loop
+except ImportError:
+    uvloop = None
+
 # Return codes: 0 = success, 1 = failure
 RETURN_CODE = 0
 
@@ -72,6 +90,11 @@ GRPC_PORT = Params.DEFAULT_GRPC_PORT
 UDP_PORT = Params.mavsdk_port
 HW_ID = None
 
+# Unix socket of the optional persistent action daemon (see --daemon). Its
+# directory is created by the service manager (RuntimeDirectory=) and is only
+# writable by the daemon's user.
+DAEMON_SOCKET_PATH = "/run/mavsdk_actions/actions.sock"
+
 # Configure logging
 logs_directory = os.path.join("logs", "action_logs")
 os.makedirs(logs_directory, exist_ok=True)
@@ -90,8 +113,16 @@ file_handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=10*1024*1
 file_handler.setLevel(logging.DEBUG)
 file_handler.setFormatter(formatter)
 
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
+# Records are handed to a background listener thread so emitting a log line
+# never performs file I/O on the asyncio loop.
+log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+log_listener = logging.handlers.QueueListener(
+    log_queue, console_handler, file_handler, respect_handler_level=True
+)
+log_listener.start()
+atexit.register(log_listener.stop)
 
 # -----------------------
 # Helper / Setup Functions
@@ -104,128 +135,290 @@ def fail():
     global RETURN_CODE
     RETURN_CODE = 1
 
+# Background LED feedback tasks still running; drained before the process exits
+_led_tasks = set()
+
+# LED strip writes are queued and applied in a worker thread, in order, so a
+# slow strip update never blocks the event loop.
+_led_queue = asyncio.Queue()
+_led_worker_task = None
+
+def _led_set(r, g, b):
+    """
+    Queues setting all LEDs to the given RGB color.
+    """
+    _enqueue_led(LEDController.set_color, r, g, b)
+
+def _led_off():
+    """
+    Queues turning all LEDs off.
+    """
+    _enqueue_led(LEDController.turn_off)
+
+def _enqueue_led(func, *args):
+    """
+    Queues an LEDController call, starting the LED worker if needed.
+    """
+    global _led_worker_task
+    if _led_worker_task is None or _led_worker_task.done():
+        _led_worker_task = asyncio.create_task(_led_worker())
+    _led_queue.put_nowait((func, args))
+
+async def _led_worker():
+    """
+    Applies queued LED commands one at a time in the default executor.
+    """
+    loop = asyncio.get_running_loop()
+    # Initialize the strip up front; set_color/turn_off hold the controller
+    # lock and must not be the ones to create the singleton.
+    try:
+        await loop.run_in_executor(None, LEDController.get_instance)
+        led_ready = True
+    except Exception:
+        logger.exception("LED initialization failed, discarding LED commands")
+        led_ready = False
+    while True:
+        func, args = await _led_queue.get()
+        try:
+            if led_ready:
+                await loop.run_in_executor(None, func, *args)
+        except Exception:
+            logger.exception("LED command failed")
+        finally:
+            _led_queue.task_done()
+
+async def _blink(color, n=3, on=0.2, off=0.2):
+    """
+    Blinks the LEDs n times with the given (r, g, b) color, ending with LEDs off.
+    The whole sequence is queued as one LEDController.write_frame() call, so
+    the strip is driven by a single worker-thread command; this coroutine just
+    waits for the sequence's duration. Cancelling it also stops the playback.
+    """
+    frames = [(color, on), ((0, 0, 0), off)] * n
+    stop_event = threading.Event()
+    _enqueue_led(LEDController.write_frame, frames, stop_event)
+    try:
+        await asyncio.sleep(n * (on + off))
+    except asyncio.CancelledError:
+        stop_event.set()
+        raise
+
+def _spawn_blink(color, n=3, on=0.2, off=0.2):
+    """
+    Runs _blink() as a background task so the calling action can return
+    immediately. The task is tracked in _led_tasks until it finishes.
+    """
+    task = asyncio.create_task(_blink(color, n, on, off))
+    _led_tasks.add(task)
+    task.add_done_callback(_led_tasks.discard)
+    return task
+
+async def _drain_led_tasks():
+    """
+    Waits for any outstanding background LED feedback to finish, applies all
+    queued LED commands and stops the LED worker.
+    """
+    global _led_worker_task
+    if _led_tasks:
+        await asyncio.gather(*_led_tasks, return_exceptions=True)
+    if _led_worker_task is not None:
+        # Don't wait on the queue if the worker has died: nothing would
+        # ever mark the remaining commands done.
+        join_task = asyncio.create_task(_led_queue.join())
+        await asyncio.wait({join_task, _led_worker_task}, return_when=asyncio.FIRST_COMPLETED)
+        if not join_task.done():
+            logger.error("LED worker stopped unexpectedly, dropping %s queued LED command(s)", _led_queue.qsize())
+            join_task.cancel()
+            _discard_led_queue()
+        _led_worker_task.cancel()
+        await asyncio.gather(join_task, _led_worker_task, return_exceptions=True)
+        _led_worker_task = None
+
+def _discard_led_queue():
+    """
+    Drops every queued LED command without applying it.
+    """
+    while not _led_queue.empty():
+        _led_queue.get_nowait()
+        _led_queue.task_done()
+
 def check_mavsdk_server_running(port):
     """
     Checks if a mavsdk_server process is already running on the specified port.
     Returns (bool, pid).
+
+    A single connect probe answers the common "port is free" case; the
+    system-wide connection table is only read when we need the owning PID.
     """
-    for proc in psutil.process_iter(['pid', 'name']):
-        try:
-            for conn in proc.net_connections(kind='inet'):
-                if conn.laddr.port == port:
-                    return True, proc.info['pid']
-        except Exception:
-            pass
-    return False, None
+    if not _port_in_use(port):
+        return False, None
 
-def wait_for_port(port, host='localhost', timeout=10.0):
+    try:
+        for conn in psutil.net_connections(kind='inet'):
+            if conn.laddr and conn.laddr.port == port and conn.status == psutil.CONN_LISTEN:
+                return True, conn.pid
+    except Exception:
+        logger.exception("Failed to look up the process listening on port %s", port)
+    return True, None
+
+def _port_in_use(port):
+    """
+    Returns True if something accepts TCP connections on the local port.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        return probe.connect_ex(('127.0.0.1', port)) == 0
+
+async def wait_for_port(port, host='localhost', timeout=10.0):
     """
     Waits until a port on the specified host is open, or until timeout is reached.
-    Returns True if open, False otherwise.
+    Polls with exponential backoff (10 ms doubling up to 200 ms) without
+    blocking the event loop. Returns True if open, False otherwise.
     """
-    start = time.time()
-    while time.time() - start < timeout:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.01
+    while loop.time() < deadline:
         try:
-            with socket.create_connection((host, port), timeout=1):
-                return True
-        except (ConnectionRefusedError, socket.timeout, OSError):
-            time.sleep(0.2)
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=0.5)
+            writer.close()
+            await writer.wait_closed()
+            return True
+        except (ConnectionRefusedError, asyncio.TimeoutError, OSError):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.2)
     return False
 
 async def log_mavsdk_output(mavsdk_server):
     """
-    Asynchronously reads MAVSDK server's stdout/stderr for logging.
+    Asynchronously drains MAVSDK server's stdout/stderr for logging.
+    Both streams are read concurrently on the event loop.
     """
-    loop = asyncio.get_event_loop()
-    try:
-        while True:
-            line = await loop.run_in_executor(None, mavsdk_server.stdout.readline)
-            if not line:
-                break
-            logger.debug(f"MAVSDK Server: {line.decode().strip()}")
-    except Exception:
-        logger.exception("Error reading MAVSDK server stdout")
+    async def _drain(stream, level, prefix):
+        # One decoder per stream; undecodable bytes are replaced rather than
+        # aborting the drain and leaving the pipe to fill up.
+        decode = codecs.getincrementaldecoder('utf-8')(errors='replace').decode
+        try:
+            while True:
+                line = await stream.readline()
+                if not line:
+                    break
+                logger.log(level, "%s: %s", prefix, decode(line).strip())
+        except Exception:
+            logger.exception("Error reading %s output", prefix)
 
-    try:
-        while True:
-            line = await loop.run_in_executor(None, mavsdk_server.stderr.readline)
-            if not line:
-                break
-            logger.error(f"MAVSDK Server Error: {line.decode().strip()}")
-    except Exception:
-        logger.exception("Error reading MAVSDK server stderr")
+    await asyncio.gather(
+        _drain(mavsdk_server.stdout, logging.DEBUG, "MAVSDK Server"),
+        _drain(mavsdk_server.stderr, logging.ERROR, "MAVSDK Server Error"),
+    )
 
 def read_hw_id():
     """
     Attempts to read the first *.hwID file in the current directory
-    and parse it as an integer hardware ID.
+    and parse it as an integer hardware ID. Not memoized: the daemon calls
+    this once per request so a renamed or newly added .hwID file is seen.
     """
-    hwid_files = glob.glob('*.hwID')
-    if hwid_files:
-        filename = hwid_files[0]
-        hw_id_str = os.path.splitext(filename)[0]
-        logger.info(f"Hardware ID file detected: {filename}")
-        try:
-            hw_id = int(hw_id_str)
-            logger.info(f"Hardware ID {hw_id} detected.")
-            return hw_id
-        except ValueError:
-            logger.error(f"Invalid hardware ID format in {filename}. Expected an integer.")
-            return None
-    else:
-        logger.warning("No .hwID file found.")
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.name.endswith('.hwID') and entry.is_file():
+                return _parse_hw_id_filename(entry.name)
+    logger.warning("No .hwID file found.")
+    return None
+
+def _parse_hw_id_filename(filename):
+    """
+    Parses the integer hardware ID from a '<hw_id>.hwID' filename.
+    """
+    hw_id_str = os.path.splitext(filename)[0]
+    logger.info("Hardware ID file detected: %s", filename)
+    try:
+        hw_id = int(hw_id_str)
+        logger.info("Hardware ID %s detected.", hw_id)
+        return hw_id
+    except ValueError:
+        logger.error("Invalid hardware ID format in %s. Expected an integer.", filename)
         return None
 
+# Column types for the drone configuration CSV, cast by the C parser in one pass
+CONFIG_DTYPES = {
+    'hw_id': 'int32',
+    'pos_id': 'int32',
+    'x': 'float64',
+    'y': 'float64',
+    'ip': str,
+    'mavlink_port': 'int32',
+    'debug_port': 'int32',
+    'gcs_ip': str,
+}
+
 def read_config(filename=Params.config_csv_name):
     """
     Reads the drone configuration from a CSV file matching the HW_ID.
     Returns a dictionary with drone_config or None if not found/failed.
     """
-    global HW_ID
     logger.info("Reading drone configuration...")
     try:
-        with open(filename, newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                hw_id = int(row.get('hw_id', -1))
-                if hw_id == HW_ID:
-                    drone_config = {
-                        'hw_id': hw_id,
-                        'pos_id': int(row.get('pos_id', -1)),
-                        'x': float(row.get('x', 0.0)),
-                        'y': float(row.get('y', 0.0)),
-                        'ip': row.get('ip', ''),
-                        'udp_port': int(row.get('mavlink_port', UDP_PORT)),
-                        'grpc_port': int(row.get('debug_port', GRPC_PORT)),
-                        'gcs_ip': row.get('gcs_ip', ''),
-                    }
-                    logger.info(f"Drone configuration: {drone_config}")
-                    return drone_config
-        logger.warning(f"No matching HW_ID {HW_ID} found in config file.")
+        config_index = _load_config_index(filename, os.stat(filename).st_mtime_ns)
     except FileNotFoundError:
-        logger.error(f"Config file '{filename}' not found.")
+        logger.error("Config file '%s' not found.", filename)
+        return None
     except Exception:
         logger.exception("Error reading config file")
-    return None
+        return None
 
-def stop_mavsdk_server(mavsdk_server):
+    drone_config = config_index.get(HW_ID)
+    if drone_config is None:
+        logger.warning("No matching HW_ID %s found in config file.", HW_ID)
+        return None
+    logger.info("Drone configuration: %s", drone_config)
+    return dict(drone_config)
+
+@functools.lru_cache(maxsize=4)
+def _load_config_index(filename, mtime_ns):
+    """
+    Parses the config CSV into a {hw_id: drone_config} dict. Memoized on
+    (filename, mtime_ns) so the file is only re-parsed after it changes.
+    The first row wins if a hw_id appears more than once.
+    """
+    # Imported here so CLI runs that never parse a CSV (e.g. forwarding to the
+    # daemon) don't pay pandas' import time
+    import pandas as pd
+
+    # Blank cells stay '' (and fail int casts) rather than becoming NaN
+    df = pd.read_csv(filename, dtype=CONFIG_DTYPES, keep_default_na=False)
+    config_index = {}
+    for row in df.to_dict('records'):
+        hw_id = int(row['hw_id'])
+        config_index.setdefault(hw_id, {
+            'hw_id': hw_id,
+            'pos_id': int(row.get('pos_id', -1)),
+            'x': float(row.get('x', 0.0)),
+            'y': float(row.get('y', 0.0)),
+            'ip': row.get('ip', ''),
+            'udp_port': int(row.get('mavlink_port', UDP_PORT)),
+            'grpc_port': int(row.get('debug_port', GRPC_PORT)),
+            'gcs_ip': row.get('gcs_ip', ''),
+        })
+    return config_index
+
+async def stop_mavsdk_server(mavsdk_server):
     """
     Gracefully stops the MAVSDK server if it's still running.
     """
-    if mavsdk_server and mavsdk_server.poll() is None:
+    if mavsdk_server and mavsdk_server.returncode is None:
         logger.info("Stopping MAVSDK server...")
         mavsdk_server.terminate()
         try:
-            mavsdk_server.wait(timeout=5)
+            await asyncio.wait_for(mavsdk_server.wait(), timeout=5)
             logger.info("MAVSDK server terminated gracefully.")
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             logger.warning("MAVSDK server did not terminate. Killing it.")
             mavsdk_server.kill()
-            mavsdk_server.wait()
+            await mavsdk_server.wait()
             logger.info("MAVSDK server killed.")
     else:
         logger.debug("MAVSDK server already stopped or never started.")
 
+@functools.lru_cache(maxsize=1)
 def find_mavsdk_server():
     """
     Finds the path to the mavsdk_server binary.
@@ -252,25 +445,32 @@ def find_mavsdk_server():
 
     return None
 
-def start_mavsdk_server(grpc_port, udp_port):
+async def start_mavsdk_server(grpc_port, udp_port, takeover=True):
     """
     Starts or restarts the MAVSDK server, ensuring any previously running server
-    on the same gRPC port is stopped first. Returns the subprocess.Popen instance.
+    on the same gRPC port is stopped first. Returns the asyncio.subprocess.Process instance.
+    With takeover=False, a port that is already in use is left alone and None is returned.
     """
     is_running, pid = check_mavsdk_server_running(grpc_port)
-    if is_running:
-        logger.info(f"MAVSDK server already running on port {grpc_port}, terminating it.")
+    if is_running and not takeover:
+        logger.error("Port %s is already in use (PID: %s), not taking it over.", grpc_port, pid)
+        return None
+    if is_running and pid is None:
+        logger.warning("Port %s is in use but its owning process could not be determined.", grpc_port)
+    elif is_running:
+        logger.info("MAVSDK server already running on port %s, terminating it.", grpc_port)
         try:
-            psutil.Process(pid).terminate()
-            psutil.Process(pid).wait(timeout=5)
-            logger.info(f"Terminated existing MAVSDK server (PID: {pid}).")
+            proc = psutil.Process(pid)
+            proc.terminate()
+            proc.wait(timeout=5)
+            logger.info("Terminated existing MAVSDK server (PID: %s).", pid)
         except psutil.NoSuchProcess:
-            logger.warning(f"No process found with PID {pid}.")
+            logger.warning("No process found with PID %s.", pid)
         except psutil.TimeoutExpired:
-            logger.warning(f"Process {pid} did not terminate, killing it.")
-            psutil.Process(pid).kill()
-            psutil.Process(pid).wait()
-            logger.info(f"Killed MAVSDK server (PID: {pid}).")
+            logger.warning("Process %s did not terminate, killing it.", pid)
+            proc.kill()
+            proc.wait()
+            logger.info("Killed MAVSDK server (PID: %s).", pid)
 
     mavsdk_server_path = find_mavsdk_server()
     if not mavsdk_server_path:
@@ -278,17 +478,17 @@ def start_mavsdk_server(grpc_port, udp_port):
         fail()
         sys.exit(1)
 
-    logger.info(f"Starting MAVSDK server: {mavsdk_server_path} on gRPC:{grpc_port}, UDP:{udp_port}")
+    logger.info("Starting MAVSDK server: %s on gRPC:%s, UDP:%s", mavsdk_server_path, grpc_port, udp_port)
     try:
-        mavsdk_server = subprocess.Popen(
-            [mavsdk_server_path, "-p", str(grpc_port), f"udp://:{udp_port}"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
+        mavsdk_server = await asyncio.create_subprocess_exec(
+            mavsdk_server_path, "-p", str(grpc_port), f"udp://:{udp_port}",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
         )
 
         asyncio.create_task(log_mavsdk_output(mavsdk_server))
 
-        if not wait_for_port(grpc_port, timeout=10):
+        if not await wait_for_port(grpc_port, timeout=10):
             logger.error("MAVSDK server did not start listening in time.")
             mavsdk_server.terminate()
             fail()
@@ -311,15 +511,37 @@ async def perform_action(action, altitude=None, parameters=None, branch=None, re
     Main entry to perform the requested action with optional altitude/parameters/branch, plus
     an optional reboot_after boolean for certain actions like apply_common_params.
     """
-    logger.info(f"Requested action: {action}, altitude: {altitude}, parameters: {parameters}, "
-                f"branch: {branch}, reboot_after: {reboot_after}")
-    global HW_ID
+    logger.info("Requested action: %s, altitude: %s, parameters: %s, branch: %s, reboot_after: %s",
+                action, altitude, parameters, branch, reboot_after)
 
     # Special case: code update
     if action == "update_code":
         await update_code(branch)
+        await _drain_led_tasks()
+        return
+
+    if not check_drone_identity(action):
         return
 
+    # Start MAVSDK if not just "update_code" (that doesn't need flight connect).
+    mavsdk_server, drone = await connect_drone(GRPC_PORT, UDP_PORT)
+    if drone is None:
+        return
+
+    try:
+        await execute_action(drone, action, altitude, parameters, reboot_after)
+    finally:
+        # Let LED feedback finish while the MAVSDK server shuts down
+        await asyncio.gather(stop_mavsdk_server(mavsdk_server), _drain_led_tasks())
+        logger.info("Action completed.")
+
+def check_drone_identity(action):
+    """
+    Reads HW_ID and, for every action except init_sysid/update_code, verifies that
+    a matching drone config exists. Returns True if the action may proceed.
+    """
+    global HW_ID
+
     # For init_sysid, we do need a valid HW_ID. That is checked later in init_sysid logic.
     # For apply_common_params or normal flight actions, we also read HW_ID for consistency.
     HW_ID = read_hw_id()
@@ -329,24 +551,28 @@ async def perform_action(action, altitude=None, parameters=None, branch=None, re
         if HW_ID is None:
             logger.error("No valid HW_ID found, cannot proceed.")
             fail()
-            return
+            return False
 
         drone_config = read_config()
         if not drone_config:
             logger.error("Drone config not found, cannot proceed.")
             fail()
-            return
+            return False
+    return True
 
-    # Start MAVSDK if not just "update_code" (that doesn't need flight connect).
-    grpc_port = GRPC_PORT
-    udp_port = UDP_PORT
-    logger.info(f"MAVSDK: gRPC Port: {grpc_port}, UDP Port: {udp_port}")
+async def connect_drone(grpc_port, udp_port, takeover=True):
+    """
+    Starts the MAVSDK server and waits for the drone to connect.
+    Returns (mavsdk_server, drone), or (None, None) on failure.
+    See start_mavsdk_server() for takeover.
+    """
+    logger.info("MAVSDK: gRPC Port: %s, UDP Port: %s", grpc_port, udp_port)
 
-    mavsdk_server = start_mavsdk_server(grpc_port, udp_port)
+    mavsdk_server = await start_mavsdk_server(grpc_port, udp_port, takeover)
     if not mavsdk_server:
         logger.error("Failed to start MAVSDK server.")
         fail()
-        return
+        return None, None
 
     drone = System(mavsdk_server_address="localhost", port=grpc_port)
     logger.info("Connecting to drone...")
@@ -355,62 +581,38 @@ async def perform_action(action, altitude=None, parameters=None, branch=None, re
     except Exception:
         logger.exception("Failed to connect to MAVSDK server")
         fail()
-        stop_mavsdk_server(mavsdk_server)
-        return
+        await stop_mavsdk_server(mavsdk_server)
+        return None, None
 
     # Wait for connection
     if not await wait_for_drone_connection(drone):
         logger.error("Drone not connected in time.")
         fail()
-        stop_mavsdk_server(mavsdk_server)
-        return
+        await stop_mavsdk_server(mavsdk_server)
+        return None, None
 
+    return mavsdk_server, drone
+
+async def execute_action(drone, action, altitude=None, parameters=None, reboot_after=False):
+    """
+    Applies any CLI parameters and runs the requested action on an already
+    connected drone. Failures are recorded through fail().
+    """
     # Set parameters if provided via CLI
     if parameters:
         await set_parameters(drone, parameters)
 
     # Execute the requested action safely
     try:
-        if action == "takeoff":
-            if not await safe_action(takeoff, drone, altitude):
-                fail()
-        elif action == "land":
-            if not await safe_action(land, drone):
-                fail()
-        elif action == "return_rtl":
-            if not await safe_action(return_rtl, drone):
-                fail()
-        elif action == "hold":
-            if not await safe_action(hold, drone):
-                fail()
-        elif action == "kill_terminate":
-            if not await safe_action(kill_terminate, drone):
-                fail()
-        elif action == "test":
-            if not await safe_action(test, drone):
-                fail()
-        elif action == "reboot_fc":
-            if not await safe_action(reboot, drone, fc_flag=True, sys_flag=False):
-                fail()
-        elif action == "reboot_sys":
-            if not await safe_action(reboot, drone, fc_flag=False, sys_flag=True):
-                fail()
-        elif action == "init_sysid":
-            # automatically set MAV_SYS_ID from HW_ID, then reboot FC
-            if not await safe_action(init_sysid, drone):
-                fail()
-        elif action == "apply_common_params":
-            if not await safe_action(apply_common_params, drone, reboot_after):
-                fail()
-        else:
-            logger.error(f"Invalid action specified: {action}")
+        handler = _ACTION_HANDLERS.get(action)
+        if handler is None:
+            logger.error("Invalid action specified: %s", action)
+            fail()
+        elif not await handler(drone, altitude, reboot_after):
             fail()
     except Exception:
-        logger.exception(f"Error performing action '{action}'")
+        logger.exception("Error performing action '%s'", action)
         fail()
-    finally:
-        stop_mavsdk_server(mavsdk_server)
-        logger.info("Action completed.")
 
 async def wait_for_drone_connection(drone, timeout=10):
     """
@@ -418,14 +620,23 @@ async def wait_for_drone_connection(drone, timeout=10):
     Returns True if connected, else False.
     """
     logger.info("Waiting for drone connection state...")
-    start = time.time()
-    async for state in drone.core.connection_state():
-        if state.is_connected:
-            logger.info("Drone connected successfully.")
-            return True
-        if time.time() - start > timeout:
-            return False
-        await asyncio.sleep(0.5)
+
+    states = drone.core.connection_state()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            state = await asyncio.wait_for(anext(states), timeout=remaining)
+            if state.is_connected:
+                logger.info("Drone connected successfully.")
+                return True
+    except (asyncio.TimeoutError, StopAsyncIteration):
+        return False
+    finally:
+        await states.aclose()
 
 async def safe_action(func, *args, **kwargs):
     """
@@ -433,66 +644,146 @@ async def safe_action(func, *args, **kwargs):
     Logs start/end, returns True if success, False if failure.
     """
     action_name = func.__name__
-    logger.info(f"Starting action: {action_name}")
+    logger.info("Starting action: %s", action_name)
     try:
         await func(*args, **kwargs)
-        logger.info(f"Action {action_name} completed successfully.")
+        logger.info("Action %s completed successfully.", action_name)
         return True
     except ActionError as ae:
-        logger.error(f"Action {action_name} failed with ActionError: {ae}")
+        logger.error("Action %s failed with ActionError: %s", action_name, ae)
         return False
     except Exception:
-        logger.exception(f"Action {action_name} failed with an unexpected error.")
+        logger.exception("Action %s failed with an unexpected error.", action_name)
         return False
 
-# Mapping of parameter names to their expected types
-PARAM_TYPES = {
-    "COM_RCL_EXCEPT": "int",
-    "GF_ACTION": "int",
-    "GF_MAX_HOR_DIST": "float",
-    "GF_MAX_VER_DIST": "float",
+# Mapping of parameter names to their (caster, type tag) pair
+_PARAM_PARSERS = {
+    "COM_RCL_EXCEPT": (int, "int"),
+    "GF_ACTION": (int, "int"),
+    "GF_MAX_HOR_DIST": (float, "float"),
+    "GF_MAX_VER_DIST": (float, "float"),
 }
 
+_FLOAT_PARSER = (float, "float")
+_INT_PARSER = (int, "int")
+
 def parse_param_value(raw_value, param_name):
     """
     Parses the raw parameter value string into the correct type based on the
-    expected type for the parameter as defined in PARAM_TYPES.
+    expected type for the parameter as defined in _PARAM_PARSERS. Unknown
+    parameters are typed by the presence of a decimal point. Values that are
+    already numbers (typed at argparse time or sent as JSON numbers) are typed
+    by their Python type and still cast to the declared type. Non-finite
+    values are rejected.
     """
-    expected_type = PARAM_TYPES.get(param_name)
+    numeric = isinstance(raw_value, (int, float))
+    if numeric:
+        default = _FLOAT_PARSER if isinstance(raw_value, float) else _INT_PARSER
+    else:
+        default = _FLOAT_PARSER if '.' in raw_value else _INT_PARSER
+    caster, tag = _PARAM_PARSERS.get(param_name) or default
     try:
-        if expected_type == "int":
-            return int(raw_value), "int"
-        elif expected_type == "float":
-            return float(raw_value), "float"
-        else:
-            # Fallback: if no mapping exists, try guessing based on a decimal point.
-            if '.' in raw_value:
-                return float(raw_value), "float"
-            else:
-                return int(raw_value), "int"
+        if tag == "int" and isinstance(raw_value, float) and not raw_value.is_integer():
+            raise ValueError(f"{raw_value} is not an integer")
+        value = caster(raw_value)
+        if isinstance(value, float) and not math.isfinite(value):
+            raise ValueError(f"non-finite value {raw_value}")
+        return value, tag
     except ValueError as e:
-        logger.error(f"Failed to parse value '{raw_value}' for parameter '{param_name}' with expected type '{expected_type}'")
+        logger.error("Failed to parse value '%s' for parameter '%s' with expected type '%s'", raw_value, param_name, tag)
         raise e
 
+# Maximum number of parameter set requests in flight at once
+_PARAM_SET_CONCURRENCY = 4
+
 async def set_parameters(drone, parameters):
     """
     Sets multiple parameters on the drone using MAVSDK's param interface.
-    The `parameters` dict should be {param_name: param_value_str}.
+    The `parameters` dict maps param_name to a value string or an already
+    typed int/float. All sets are issued concurrently so their round-trips overlap.
     """
+    parsed = []
     for param_name, raw_value in parameters.items():
         try:
             param_value, param_type = parse_param_value(raw_value, param_name)
-            logger.info(f"Setting param '{param_name}' to {param_value} (type: {param_type})")
-            if param_type == "int":
-                await drone.param.set_param_int(param_name, param_value)
-            elif param_type == "float":
-                await drone.param.set_param_float(param_name, param_value)
-            else:
-                raise ValueError(f"Unsupported parameter type for {param_name}")
-            logger.info(f"Param '{param_name}' set successfully.")
         except Exception as e:
-            logger.exception(f"Failed to set param '{param_name}': {e}")
-            fail()  # Assuming fail() handles the error as per your project's conventions
+            logger.exception("Failed to set param '%s': %s", param_name, e)
+            fail()
+            continue
+        parsed.append((param_name, param_value, param_type))
+    for param_name, param_value, param_type in parsed:
+        logger.info("Setting param '%s' to %s (type: %s)", param_name, param_value, param_type)
+
+    results = await _set_params_concurrent(drone, parsed)
+    unconfirmed = [p for p, result in zip(parsed, results) if isinstance(result, Exception)]
+
+    if unconfirmed:
+        # A failed ack does not mean the value didn't land: read everything back
+        # once and retry only the parameters that really differ.
+        unconfirmed = await _retry_unconfirmed_params(drone, unconfirmed)
+
+    failed = {name for name, _, _ in unconfirmed}
+    for param_name, _, _ in parsed:
+        if param_name in failed:
+            logger.error("Failed to set param '%s'.", param_name)
+            fail()
+        else:
+            logger.info("Param '%s' set successfully.", param_name)
+
+async def _set_params_concurrent(drone, parsed):
+    """
+    Sets the parsed (name, value, type) entries concurrently, with at most
+    _PARAM_SET_CONCURRENCY requests in flight so PX4's parameter handling and
+    the MAVLink link buffers are not flooded. Returns one result or exception
+    per entry, in order.
+    """
+    semaphore = asyncio.Semaphore(_PARAM_SET_CONCURRENCY)
+
+    async def _bounded_set(entry):
+        async with semaphore:
+            await _set_param(drone, *entry)
+
+    return await asyncio.gather(*(_bounded_set(entry) for entry in parsed), return_exceptions=True)
+
+async def _set_param(drone, name, value, param_type):
+    """
+    Sets a single already-parsed parameter via the matching MAVSDK setter.
+    """
+    if param_type == "int":
+        await drone.param.set_param_int(name, value)
+    else:
+        await drone.param.set_param_float(name, value)
+
+async def _retry_unconfirmed_params(drone, unconfirmed):
+    """
+    Verifies parameters whose set call errored against a single
+    get_all_params() read-back and retries the mismatches once.
+    Returns the (name, value, type) entries that still could not be set.
+    """
+    try:
+        all_params = await drone.param.get_all_params()
+    except Exception as e:
+        logger.warning("Parameter read-back failed, retrying all unconfirmed sets: %s", e)
+        mismatched = unconfirmed
+    else:
+        current = {p.name: p.value for p in all_params.int_params}
+        current.update({p.name: p.value for p in all_params.float_params})
+        mismatched = [
+            (name, value, param_type) for name, value, param_type in unconfirmed
+            if name not in current or not math.isclose(current[name], value, rel_tol=1e-6)
+        ]
+
+    if not mismatched:
+        return []
+
+    logger.warning("Retrying %s unconfirmed parameter(s)...", len(mismatched))
+    results = await _set_params_concurrent(drone, mismatched)
+    still_failed = []
+    for entry, result in zip(mismatched, results):
+        if isinstance(result, Exception):
+            logger.error("Retry of param '%s' failed: %s", entry[0], result)
+            still_failed.append(entry)
+    return still_failed
 
 async def apply_common_params(drone, reboot_after=False):
     """
@@ -507,50 +798,41 @@ async def apply_common_params(drone, reboot_after=False):
       GF_MAX_HOR_DIST,3000
       GF_MAX_VER_DIST,120
     """
-    led_controller = LEDController.get_instance()
     common_file = 'common_params.csv'
 
     # Indicate start with a distinct LED color (e.g., magenta)
-    led_controller.set_color(255, 0, 255)
+    _led_set(255, 0, 255)
     await asyncio.sleep(0.5)
 
     if not os.path.isfile(common_file):
-        logger.error(f"Common parameter file '{common_file}' not found.")
+        logger.error("Common parameter file '%s' not found.", common_file)
         fail()
         return
 
-    logger.info(f"Loading common parameters from {common_file} ...")
+    logger.info("Loading common parameters from %s ...", common_file)
     try:
-        common_params = {}
-        with open(common_file, newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                param_name = row['param_name'].strip()
-                param_value = row['param_value'].strip()
-                common_params[param_name] = param_value
-
-        logger.info(f"Found {len(common_params)} common parameters. Applying now...")
-        await set_parameters(drone, common_params)
+        import pandas as pd
 
-        # Blink green a few times for success feedback
-        for _ in range(3):
-            led_controller.set_color(0, 255, 0)
-            await asyncio.sleep(0.2)
-            led_controller.turn_off()
-            await asyncio.sleep(0.2)
+        # Blank values stay '' so parse_param_value() rejects them
+        df = pd.read_csv(common_file, dtype=str, keep_default_na=False)
+        common_params = dict(zip(df['param_name'].str.strip(), df['param_value'].str.strip()))
+
+        logger.info("Found %s common parameters. Applying now...", len(common_params))
+        await set_parameters(drone, common_params)
 
         if reboot_after:
             logger.info("Rebooting flight controller as requested...")
             await drone.action.reboot()
-            led_controller.set_color(255, 255, 0)
-            await asyncio.sleep(1.0)
+
+        # Blink green a few times for success feedback
+        _spawn_blink((0, 255, 0))
 
         logger.info("apply_common_params action completed successfully.")
     except Exception:
         logger.exception("Error applying common parameters")
         fail()
     finally:
-        led_controller.turn_off()
+        _led_off()
 
 # -----------------------
 # Action Implementations
@@ -582,42 +864,35 @@ async def takeoff(drone, altitude):
     """
     Arms and takes off to the specified altitude (in meters).
     """
-    led_controller = LEDController.get_instance()
     # Check preflight conditions
     if not await ensure_ready_for_flight(drone):
         raise Exception("Preflight conditions not met (GPS/Home)")
 
     # Try arming
     try:
-        led_controller.set_color(255, 255, 0)  # Yellow: starting
+        _led_set(255, 255, 0)  # Yellow: starting
         await asyncio.sleep(0.5)
         await drone.action.set_takeoff_altitude(float(altitude))
         await drone.action.arm()
-        led_controller.set_color(255, 255, 255)  # White: armed
+        _led_set(255, 255, 255)  # White: armed
         await asyncio.sleep(0.5)
         await drone.action.takeoff()
     except ActionError as e:
-        logger.error(f"Failed to take off: {e}")
+        logger.error("Failed to take off: %s", e)
         raise
     except Exception:
         logger.exception("Unexpected error during takeoff")
         raise
 
     # Indicate success with green blinks
-    for _ in range(3):
-        led_controller.set_color(0, 255, 0)
-        await asyncio.sleep(0.2)
-        led_controller.turn_off()
-        await asyncio.sleep(0.2)
-    led_controller.turn_off()
+    _spawn_blink((0, 255, 0))
     logger.info("Takeoff successful.")
 
 async def land(drone):
     """
     Commands the drone to land safely.
     """
-    led_controller = LEDController.get_instance()
-    led_controller.set_color(255, 255, 0)  # Yellow
+    _led_set(255, 255, 0)  # Yellow
     await asyncio.sleep(0.5)
 
     try:
@@ -625,23 +900,14 @@ async def land(drone):
         await asyncio.sleep(1)
 
         # Indicate landing in progress (blue pulses)
-        for _ in range(3):
-            led_controller.set_color(0, 0, 255)
-            await asyncio.sleep(0.5)
-            led_controller.turn_off()
-            await asyncio.sleep(0.5)
+        await _blink((0, 0, 255), on=0.5, off=0.5)
 
         await drone.action.land()
 
-        for _ in range(3):
-            led_controller.set_color(0, 255, 0)
-            await asyncio.sleep(0.2)
-            led_controller.turn_off()
-            await asyncio.sleep(0.2)
-        led_controller.turn_off()
+        _spawn_blink((0, 255, 0))
         logger.info("Landing successful.")
     except ActionError as e:
-        logger.error(f"Landing failed: {e}")
+        logger.error("Landing failed: %s", e)
         raise
     except Exception:
         logger.exception("Unexpected error during landing")
@@ -651,31 +917,21 @@ async def return_rtl(drone):
     """
     Commands the drone to return to launch (home) position.
     """
-    led_controller = LEDController.get_instance()
-    led_controller.set_color(255, 0, 255)  # Purple start
+    _led_set(255, 0, 255)  # Purple start
     await asyncio.sleep(0.5)
 
     try:
         await drone.action.hold()
         await asyncio.sleep(1)
 
-        for _ in range(3):
-            led_controller.set_color(0, 0, 255)
-            await asyncio.sleep(0.5)
-            led_controller.turn_off()
-            await asyncio.sleep(0.5)
+        await _blink((0, 0, 255), on=0.5, off=0.5)
 
         await drone.action.return_to_launch()
 
-        for _ in range(3):
-            led_controller.set_color(0, 255, 0)
-            await asyncio.sleep(0.2)
-            led_controller.turn_off()
-            await asyncio.sleep(0.2)
-        led_controller.turn_off()
+        _spawn_blink((0, 255, 0))
         logger.info("RTL successful.")
     except ActionError as e:
-        logger.error(f"RTL failed: {e}")
+        logger.error("RTL failed: %s", e)
         raise
     except Exception:
         logger.exception("Unexpected error during RTL")
@@ -685,27 +941,20 @@ async def kill_terminate(drone):
     """
     Immediately terminates the drone (emergency kill).
     """
-    led_controller = LEDController.get_instance()
-    led_controller.set_color(255, 0, 0)
+    _led_set(255, 0, 0)
     await asyncio.sleep(0.2)
-    led_controller.set_color(0, 0, 0)
-    led_controller.set_color(255, 0, 0)
+    _led_set(0, 0, 0)
+    _led_set(255, 0, 0)
     await asyncio.sleep(0.2)
 
     try:
         await drone.action.terminate()
         await asyncio.sleep(1)
-        for _ in range(3):
-            led_controller.set_color(0, 255, 0)
-            await asyncio.sleep(0.2)
-            led_controller.turn_off()
-            await asyncio.sleep(0.2)
-        led_controller.turn_off()
-        await asyncio.sleep(0.2)
-        led_controller.set_color(255, 0, 0)
+        await _blink((0, 255, 0))
+        _led_set(255, 0, 0)
         logger.info("Kill and Terminate successful.")
     except ActionError as e:
-        logger.error(f"Kill terminate failed: {e}")
+        logger.error("Kill terminate failed: %s", e)
         raise
     except Exception:
         logger.exception("Unexpected error during kill terminate")
@@ -715,17 +964,16 @@ async def hold(drone):
     """
     Commands the drone to hold (loiter) at current position.
     """
-    led_controller = LEDController.get_instance()
-    led_controller.set_color(0, 0, 255)
+    _led_set(0, 0, 255)
     await asyncio.sleep(0.5)
     try:
         await drone.action.hold()
-        led_controller.set_color(0, 0, 255)
+        _led_set(0, 0, 255)
         await asyncio.sleep(1)
-        led_controller.turn_off()
+        _led_off()
         logger.info("Hold successful.")
     except ActionError as e:
-        logger.error(f"Hold failed: {e}")
+        logger.error("Hold failed: %s", e)
         raise
     except Exception:
         logger.exception("Unexpected error during hold")
@@ -735,22 +983,21 @@ async def test(drone):
     """
     A simple test action to verify connectivity and LED control.
     """
-    led_controller = LEDController.get_instance()
     try:
-        led_controller.set_color(255, 0, 0)
+        _led_set(255, 0, 0)
         await asyncio.sleep(1)
         await drone.action.arm()
-        led_controller.set_color(255, 255, white)
+        _led_set(255, 255, white)
         await asyncio.sleep(1)
-        led_controller.set_color(0, 0, 255)
+        _led_set(0, 0, 255)
         await asyncio.sleep(1)
-        led_controller.set_color(0, 255, 0)
+        _led_set(0, 255, 0)
         await asyncio.sleep(1)
         await drone.action.disarm()
-        led_controller.turn_off()
+        _led_off()
         logger.info("Test action successful.")
     except ActionError as e:
-        logger.error(f"Test action failed: {e}")
+        logger.error("Test action failed: %s", e)
         raise
     except Exception:
         logger.exception("Unexpected error during test")
@@ -760,28 +1007,23 @@ async def reboot(drone, fc_flag, sys_flag, force_reboot=True):
     """
     Reboots flight controller or entire system (Linux-based), or both.
     """
-    led_controller = LEDController.get_instance()
-    led_controller.set_color(255, 255, 0)
+    _led_set(255, 255, 0)
     await asyncio.sleep(0.5)
 
     try:
         if fc_flag:
             await drone.action.reboot()
-            for _ in range(3):
-                led_controller.set_color(0, 255, 0)
-                await asyncio.sleep(0.2)
-                led_controller.turn_off()
-                await asyncio.sleep(0.2)
+            _spawn_blink((0, 255, 0))
             logger.info("FC reboot successful.")
 
         if sys_flag:
             logger.info("Initiating system reboot...")
-            led_controller.turn_off()
+            _led_off()
             await reboot_system()
 
-        led_controller.turn_off()
+        _led_off()
     except ActionError as e:
-        logger.error(f"Reboot failed: {e}")
+        logger.error("Reboot failed: %s", e)
         raise
     except Exception:
         logger.exception("Unexpected error during reboot")
@@ -789,8 +1031,22 @@ async def reboot(drone, fc_flag, sys_flag, force_reboot=True):
 
 async def reboot_system():
     """
-    Reboots the entire system via D-Bus (for Linux-based OS).
+    Reboots the entire system (for Linux-based OS). Prefers exec'ing
+    'systemctl reboot', which replaces this process without spawning a child;
+    falls back to D-Bus if systemctl is unavailable or cannot be executed.
     """
+    if shutil.which('systemctl'):
+        logger.info("Rebooting system via systemctl...")
+        # exec replaces this process: apply queued LED commands and flush
+        # queued log records first, since atexit handlers will not run
+        await _drain_led_tasks()
+        log_listener.stop()
+        try:
+            os.execvp('systemctl', ['systemctl', 'reboot'])
+        except OSError:
+            log_listener.start()
+            logger.exception("Failed to exec systemctl, falling back to D-Bus")
+
     process = await asyncio.create_subprocess_exec(
         'dbus-send', '--system', '--print-reply', '--dest=org.freedesktop.login1',
         '/org/freedesktop/login1', 'org.freedesktop.login1.Manager.Reboot', 'boolean:true',
@@ -798,7 +1054,7 @@ async def reboot_system():
     )
     stdout, stderr = await process.communicate()
     if process.returncode != 0:
-        logger.error(f"System reboot via D-Bus failed: {stderr.decode().strip()}")
+        logger.error("System reboot via D-Bus failed: %s", stderr.decode().strip())
     else:
         logger.info("System reboot command executed successfully.")
 
@@ -808,8 +1064,7 @@ async def update_code(branch=None):
     Optionally checks out a specific branch.
     """
     global RETURN_CODE
-    led_controller = LEDController.get_instance()
-    led_controller.set_color(255, 255, 0)
+    _led_set(255, 255, 0)
     await asyncio.sleep(0.5)
 
     try:
@@ -817,7 +1072,7 @@ async def update_code(branch=None):
         command = [script_path]
         if branch:
             command.append(branch)
-        logger.info(f"Executing update script: {' '.join(command)}")
+        logger.info("Executing update script: %s", ' '.join(command))
 
         process = await asyncio.create_subprocess_exec(
             *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
@@ -825,28 +1080,18 @@ async def update_code(branch=None):
         stdout, stderr = await process.communicate()
 
         if process.returncode != 0:
-            logger.error(f"Update script failed: {stderr.decode().strip()}")
+            logger.error("Update script failed: %s", stderr.decode().strip())
             fail()
-            for _ in range(3):
-                led_controller.set_color(255, 0, 0)
-                await asyncio.sleep(0.2)
-                led_controller.turn_off()
-                await asyncio.sleep(0.2)
+            _spawn_blink((255, 0, 0))
         else:
-            logger.info(f"Update script successful: {stdout.decode().strip()}")
-            for _ in range(3):
-                led_controller.set_color(0, 255, 0)
-                await asyncio.sleep(0.2)
+            logger.info("Update script successful: %s", stdout.decode().strip())
+            _spawn_blink((0, 255, 0))
     except Exception:
         logger.exception("Update code action failed")
         fail()
-        for _ in range(3):
-            led_controller.set_color(255, 0, 0)
-            await asyncio.sleep(0.2)
-            led_controller.turn_off()
-            await asyncio.sleep(0.2)
+        _spawn_blink((255, 0, 0))
     finally:
-        led_controller.turn_off()
+        _led_off()
 
 # -----------------------
 # Action: init_sysid
@@ -857,83 +1102,378 @@ async def init_sysid(drone):
     Automatically set MAV_SYS_ID based on the hardware ID file and
     then reboot the flight controller.
     """
-    led_controller = LEDController.get_instance()
-
     # We rely on the global HW_ID already read in perform_action().
     global HW_ID
 
     if HW_ID is None:
         raise Exception("HW_ID not found or invalid. Cannot init system ID.")
 
-    logger.info(f"Initializing system ID: MAV_SYS_ID = {HW_ID}")
+    logger.info("Initializing system ID: MAV_SYS_ID = %s", HW_ID)
 
+    blink_task = None
+    succeeded = False
     try:
-        # Indicate start with yellow LED
-        led_controller.set_color(255, 255, 0)
-        await asyncio.sleep(0.5)
+        # Cyan while the param set is in flight; the awaited RPC holds the color
+        _led_set(0, 255, 255)
 
         # Set MAV_SYS_ID param
         await drone.param.set_param_int("MAV_SYS_ID", HW_ID)
         logger.info("MAV_SYS_ID parameter set successfully.")
 
-        # Reboot FC to make the new system ID take effect
-        led_controller.set_color(0, 255, 255)  # Cyan to indicate reboot in progress
-        await asyncio.sleep(0.5)
-
+        # Reboot FC to make the new system ID take effect. The success blink
+        # runs while the reboot command is being acknowledged.
         logger.info("Rebooting flight controller for system ID change...")
+        blink_task = _spawn_blink((0, 255, 0))
         await drone.action.reboot()
 
-        # Blink green a few times for success
-        for _ in range(3):
-            led_controller.set_color(0, 255, 0)
-            await asyncio.sleep(0.2)
-            led_controller.turn_off()
-            await asyncio.sleep(0.2)
-
+        succeeded = True
         logger.info("init_sysid action completed successfully.")
     except ActionError as e:
-        logger.error(f"init_sysid failed with ActionError: {e}")
-        raise
-    except Exception:
-        logger.exception("Unexpected error during init_sysid")
+        logger.error("init_sysid failed with ActionError: %s", e)
         raise
     finally:
-        led_controller.turn_off()
+        if not succeeded:
+            # Don't leave a success blink running after a failure
+            if blink_task is not None:
+                blink_task.cancel()
+                await asyncio.gather(blink_task, return_exceptions=True)
+            _led_off()
 
 # -----------------------
-# Main Entry Point
+# Action Dispatch
 # -----------------------
 
-if __name__ == "__main__":
+# Flight actions run by execute_action(). Each handler takes
+# (drone, altitude, reboot_after) and returns True on success.
+_ACTION_HANDLERS = {
+    "takeoff": lambda drone, altitude, reboot_after: safe_action(takeoff, drone, altitude),
+    "land": lambda drone, altitude, reboot_after: safe_action(land, drone),
+    "return_rtl": lambda drone, altitude, reboot_after: safe_action(return_rtl, drone),
+    "hold": lambda drone, altitude, reboot_after: safe_action(hold, drone),
+    "kill_terminate": lambda drone, altitude, reboot_after: safe_action(kill_terminate, drone),
+    "test": lambda drone, altitude, reboot_after: safe_action(test, drone),
+    "reboot_fc": lambda drone, altitude, reboot_after: safe_action(reboot, drone, fc_flag=True, sys_flag=False),
+    "reboot_sys": lambda drone, altitude, reboot_after: safe_action(reboot, drone, fc_flag=False, sys_flag=True),
+    # automatically set MAV_SYS_ID from HW_ID, then reboot FC
+    "init_sysid": lambda drone, altitude, reboot_after: safe_action(init_sysid, drone),
+    "apply_common_params": lambda drone, altitude, reboot_after: safe_action(apply_common_params, drone, reboot_after),
+}
+
+# update_code needs no drone connection and is handled before dispatch
+ACTION_CHOICES = ("update_code", *_ACTION_HANDLERS)
+
+# -----------------------
+# Persistent Action Daemon
+# -----------------------
+
+# Safety actions that cancel whatever the daemon is running or has queued
+# instead of waiting their turn
+_PREEMPTING_ACTIONS = frozenset({"land", "return_rtl", "kill_terminate"})
+
+async def run_daemon(socket_path=DAEMON_SOCKET_PATH):
+    """
+    Keeps a MAVSDK server and drone connection open and serves action requests
+    received as JSON lines on a Unix socket. Each request is answered with a
+    single status byte ('0' success, '1' failure). Runs until SIGINT/SIGTERM.
+
+    Requests run one at a time, each in its own task. A request is cancelled
+    when its client disconnects (e.g. the coordinator killed the forwarding
+    actions.py), and safety actions cancel all outstanding requests.
+
+    Mission scripts own the gRPC port: the daemon only starts its MAVSDK server
+    once the port is free, and exits (removing its socket, so callers run
+    locally again) as soon as that server dies, e.g. because a mission took the
+    port over. It also exits after a successful update_code, init_sysid or
+    MAV_SYS_ID change so the service manager restarts it on the new code or
+    with a fresh connection.
+    """
+    global RETURN_CODE
+    stop_event = asyncio.Event()
+    restart_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    # Outside systemd the socket directory may not exist yet; fail here,
+    # before a MAVSDK server has been started, if it cannot be created.
+    os.makedirs(os.path.dirname(socket_path), exist_ok=True)
+
+    if not await _wait_for_free_port(GRPC_PORT, stop_event):
+        return
+    mavsdk_server, drone = await connect_drone(GRPC_PORT, UDP_PORT, takeover=False)
+    if drone is None:
+        return
+
+    request_lock = asyncio.Lock()
+    active_requests = set()
+
+    async def _run_request(request):
+        global RETURN_CODE
+        async with request_lock:
+            RETURN_CODE = 0
+            try:
+                await _serve_request(drone, request)
+            except asyncio.CancelledError:
+                logger.warning("Daemon request '%s' cancelled.", request.get("action"))
+                for task in list(_led_tasks):
+                    task.cancel()
+                raise
+            finally:
+                await _drain_led_tasks()
+            return RETURN_CODE
+
+    async def _handle_client(reader, writer):
+        status = 1
+        client_gone = False
+        action = None
+        try:
+            request = json.loads(await reader.readline())
+            if not isinstance(request, dict):
+                raise ValueError(f"expected a JSON object, got {type(request).__name__}")
+            action = request.get("action")
+            if action in _PREEMPTING_ACTIONS and active_requests:
+                logger.warning("'%s' pre-empts %s outstanding daemon request(s).", action, len(active_requests))
+                for task in list(active_requests):
+                    task.cancel()
+            request_task = asyncio.create_task(_run_request(request))
+            active_requests.add(request_task)
+            request_task.add_done_callback(active_requests.discard)
+
+            # The client sends nothing after its request line, so a completed
+            # read means it has gone away.
+            disconnect_task = asyncio.create_task(reader.read(1))
+            await asyncio.wait({request_task, disconnect_task}, return_when=asyncio.FIRST_COMPLETED)
+            if not request_task.done():
+                logger.warning("Daemon client disconnected, cancelling '%s'.", action)
+                client_gone = True
+                request_task.cancel()
+            disconnect_task.cancel()
+            result = (await asyncio.gather(request_task, disconnect_task, return_exceptions=True))[0]
+            if isinstance(result, Exception):
+                logger.error("Daemon request '%s' failed: %s", action, result, exc_info=result)
+            elif isinstance(result, int):
+                status = result
+        except Exception:
+            logger.exception("Failed to handle daemon request")
+        try:
+            if not client_gone:
+                writer.write(str(status).encode())
+                await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        except Exception:
+            logger.exception("Failed to reply to daemon client")
+        if status == 0 and _needs_restart(request):
+            logger.info("'%s' changed the code or system ID, restarting the action daemon.", action)
+            restart_event.set()
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = await asyncio.start_unix_server(_handle_client, path=socket_path)
+    logger.info("Action daemon listening on %s", socket_path)
+
+    exit_waiters = {
+        asyncio.create_task(stop_event.wait()),
+        asyncio.create_task(restart_event.wait()),
+        asyncio.create_task(mavsdk_server.wait()),
+    }
+    try:
+        async with server:
+            await asyncio.wait(exit_waiters, return_when=asyncio.FIRST_COMPLETED)
+            # Stop advertising the daemon first so new callers run locally
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            server.close()
+            for task in list(active_requests):
+                task.cancel()
+            await asyncio.gather(*active_requests, return_exceptions=True)
+    finally:
+        for task in exit_waiters:
+            task.cancel()
+        await asyncio.gather(*exit_waiters, return_exceptions=True)
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        if mavsdk_server.returncode is not None and not stop_event.is_set():
+            logger.error("MAVSDK server exited (code %s), stopping the action daemon.", mavsdk_server.returncode)
+            RETURN_CODE = 1
+        else:
+            RETURN_CODE = 0
+        await stop_mavsdk_server(mavsdk_server)
+        logger.info("Action daemon stopped.")
+
+def _needs_restart(request):
+    """
+    Returns True if a successful request leaves the daemon's connection stale:
+    update_code (old code loaded) or a MAV_SYS_ID change (System still bound
+    to the old system ID).
+    """
+    if request.get("action") in ("update_code", "init_sysid"):
+        return True
+    return "MAV_SYS_ID" in (request.get("parameters") or {})
+
+async def _wait_for_free_port(port, stop_event, poll_interval=2.0):
+    """
+    Waits until nothing listens on the given port, without touching its owner.
+    Returns False if stop_event is set first.
+    """
+    if _port_in_use(port):
+        logger.info("Port %s is in use by another process (e.g. a running mission), waiting for it.", port)
+    while _port_in_use(port):
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=poll_interval)
+        except asyncio.TimeoutError:
+            continue
+        return False
+    return not stop_event.is_set()
+
+async def _serve_request(drone, request):
+    """
+    Runs one forwarded CLI request against the daemon's connected drone.
+    """
+    action = request.get("action")
+    logger.info("Daemon request: %s", request)
+    if action == "update_code":
+        await update_code(request.get("branch"))
+        return
+    if not check_drone_identity(action):
+        return
+    # The link may have dropped since the last request (e.g. after reboot_fc)
+    if not await wait_for_drone_connection(drone):
+        logger.error("Drone not connected, cannot run '%s'.", action)
+        fail()
+        return
+    await execute_action(
+        drone,
+        action,
+        altitude=request.get("altitude"),
+        parameters=request.get("parameters"),
+        reboot_after=request.get("reboot_after", False),
+    )
+
+def forward_to_daemon(request, socket_path=DAEMON_SOCKET_PATH):
+    """
+    Sends the request to a running action daemon, if any.
+    Returns the daemon's return code, or None if no daemon is reachable.
+    """
+    if not os.path.exists(socket_path):
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError as e:
+            logger.warning("Action daemon at %s not reachable (%s), running locally.", socket_path, e)
+            return None
+
+        logger.info("Forwarding action '%s' to daemon at %s", request.get('action'), socket_path)
+        try:
+            sock.sendall((json.dumps(request) + "\n").encode())
+            status = sock.recv(1)
+        except OSError:
+            logger.exception("Lost connection to action daemon")
+            return 1
+    return 0 if status == b"0" else 1
+
+# -----------------------
+# Command-Line Interface
+# -----------------------
+
+class _ParamAction(argparse.Action):
+    """
+    Collects --param NAME VALUE pairs, typing each value once at parse time
+    with parse_param_value() so downstream code receives ints and floats.
+    """
+    def __call__(self, parser, namespace, values, option_string=None):
+        param_name, raw_value = values
+        try:
+            param_value, _ = parse_param_value(raw_value, param_name)
+        except ValueError:
+            parser.error(f"invalid value '{raw_value}' for parameter '{param_name}'")
+        params = getattr(namespace, self.dest) or []
+        params.append((param_name, param_value))
+        setattr(namespace, self.dest, params)
+
+@functools.lru_cache(maxsize=1)
+def get_args():
+    """
+    Builds the argument parser and parses the command line once;
+    later calls return the cached Namespace.
+    """
     parser = argparse.ArgumentParser(description="Perform actions with drones.")
-    parser.add_argument('--action',
-                        help='Actions: takeoff, land, hold, test, reboot_fc, reboot_sys, update_code, '
-                             'return_rtl, kill_terminate, init_sysid, apply_common_params')
+    parser.add_argument('--action', choices=ACTION_CHOICES,
+                        help='Action to perform: ' + ', '.join(ACTION_CHOICES))
     parser.add_argument('--altitude', type=float, default=10.0, help='Altitude (meters) for takeoff')
-    parser.add_argument('--param', action='append', nargs=2, metavar=('param_name', 'param_value'),
+    parser.add_argument('--param', action=_ParamAction, nargs=2, metavar=('param_name', 'param_value'),
                         help='Set one or more PX4 parameters, e.g.: --param MPC_XY_CRUISE 5.0 --param MAV_SYS_ID 4')
     parser.add_argument('--branch', type=str, help='Branch name for code update')
     parser.add_argument('--reboot_after', action='store_true',
                         help='If set, certain actions (e.g. apply_common_params) will reboot FC at the end')
-
+    parser.add_argument('--daemon', action='store_true',
+                        help=f'Run as a persistent action daemon on {DAEMON_SOCKET_PATH}, keeping MAVSDK connected')
     args = parser.parse_args()
+    if not args.daemon and args.action is None:
+        parser.error("--action is required")
+    return args
 
-    # Convert all param pairs into a dictionary { 'param_name': 'param_value_str', ... }
-    parameters = {p[0]: p[1] for p in args.param} if args.param else None
+@functools.lru_cache(maxsize=1)
+def get_parameters():
+    """
+    Returns the --param pairs as { 'param_name': typed_value, ... },
+    or None if none were given. Cached alongside get_args().
+    """
+    args = get_args()
+    return dict(args.param) if args.param else None
 
+def run_async(coro):
+    """
+    Runs the coroutine to completion on a new event loop, using uvloop when
+    it is installed, and closes the loop afterwards.
+    """
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
     try:
-        asyncio.run(
-            perform_action(
-                action=args.action,
-                altitude=args.altitude,
-                parameters=parameters,
-                branch=args.branch,
-                reboot_after=args.reboot_after
-            )
-        )
-    except Exception:
-        logger.exception("An unexpected error occurred in the main block.")
-        fail()
+        return loop.run_until_complete(coro)
     finally:
-        logger.info("Operation completed.")
-        sys.exit(RETURN_CODE)
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+# -----------------------
+# Main Entry Point
+# -----------------------
+
+if __name__ == "__main__":
+    args = get_args()
+    parameters = get_parameters()
+
+    try:
+        if args.daemon:
+            run_async(run_daemon())
+        else:
+            request = {
+                'action': args.action,
+                'altitude': args.altitude,
+                'parameters': parameters,
+                'branch': args.branch,
+                'reboot_after': args.reboot_after,
+            }
+            daemon_code = forward_to_daemon(request)
+            if daemon_code is not None:
+                RETURN_CODE = daemon_code
+            else:
+                run_async(perform_action(**request))
+    except (ActionError, OSError):
+        logger.exception("Action failed in the main block.")
+        fail()
+
+    # Anything else propagates and exits through normal interpreter shutdown
+    # with a traceback. On the expected path, os._exit skips teardown and
+    # atexit handlers; the MAVSDK server is already stopped, so only the
+    # queued logs need flushing.
+    logger.info("Operation completed.")
+    log_listener.stop()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(RETURN_CODE)
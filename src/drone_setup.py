@@ -13,6 +13,12 @@ from src.enums import Mission, State  # Ensure this import contains the necessar
 
 logger = logging.getLogger(__name__)
 
+# Short-lived action scripts are launched with docstrings and asserts stripped
+# (-OO) and a fixed hash seed to trim interpreter start-up per command.
+FAST_START_SCRIPTS = {"actions.py"}
+FAST_START_FLAGS = ["-OO"]
+FAST_START_ENV = {"PYTHONHASHSEED": "0"}
+
 class DroneSetup:
     """
     DroneSetup manages execution of drone missions (drone shows, takeoff, landing, etc.) via mission scripts.
@@ -161,14 +167,21 @@ class DroneSetup:
                 self._reset_mission_state(success=False)
                 return (False, f"Script '{script_name}' not found.")
 
-            command = [python_exec_path, script_path] + action.split()
+            env = None
+            interpreter_flags = []
+            if script_name in FAST_START_SCRIPTS:
+                interpreter_flags = FAST_START_FLAGS
+                env = {**os.environ, **FAST_START_ENV}
+
+            command = [python_exec_path, *interpreter_flags, script_path] + action.split()
             logger.info(f"Executing mission script asynchronously: {' '.join(command)}")
 
             try:
                 process = await asyncio.create_subprocess_exec(
                     *command,
                     stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
+                    stderr=asyncio.subprocess.PIPE,
+                    env=env
                 )
                 self.running_processes[script_name] = process
 
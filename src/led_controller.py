@@ -121,6 +121,36 @@ class LEDController:
                     instance.strip.show()
             instance.logger.debug("Performed theater chase with R:%d, G:%d, B:%d", r, g, b)
 
+    @staticmethod
+    def write_frame(frames, stop_event=None):
+        """
+        Plays a sequence of (color, duration) frames, where color is an (r, g, b)
+        tuple held for duration seconds. The lock and strip are acquired once for
+        the whole sequence instead of once per color change. If stop_event (a
+        threading.Event) is set, playback stops at the current frame.
+        """
+        #in sim_mode we have no LED
+        if Params.sim_mode:
+            return
+        with LEDController._lock:
+            instance = LEDController.get_instance()
+            if instance.strip is None:
+                return  # Simulation mode; do nothing
+            num_pixels = instance.strip.numPixels()
+            for (r, g, b), duration in frames:
+                if stop_event is not None and stop_event.is_set():
+                    instance.logger.debug("LED frame playback stopped")
+                    return
+                color = Color(r, g, b)
+                for i in range(num_pixels):
+                    instance.strip.setPixelColor(i, color)
+                instance.strip.show()
+                if stop_event is not None:
+                    stop_event.wait(duration)
+                else:
+                    time.sleep(duration)
+            instance.logger.debug("Played %d LED frames", len(frames))
+
     @staticmethod
     def turn_off():
         """
@@ -0,0 +1,49 @@
+#!/bin/bash
+# Install MAVSDK Action Daemon Service
+
+echo "-----------------------------------------"
+echo "Installing MAVSDK Action Daemon Service"
+echo "-----------------------------------------"
+
+# Check if we're running as root (necessary to install systemd services)
+if [[ $EUID -ne 0 ]]; then
+    echo "Error: This script must be run as root!" 1>&2
+    exit 1
+fi
+
+# Define paths
+ACTIONS_SCRIPT="/home/droneshow/mavsdk_drone_show/actions.py"
+SERVICE_FILE="/etc/systemd/system/actions_daemon.service"
+SOURCE_SERVICE_FILE="/home/droneshow/mavsdk_drone_show/tools/actions_daemon/actions_daemon.service"
+
+# Step 1: Check if the actions script exists
+if [ ! -f "$ACTIONS_SCRIPT" ]; then
+    echo "Error: Actions script not found at $ACTIONS_SCRIPT!" 1>&2
+    exit 1
+fi
+
+# Step 2: Install or replace the service file
+if [ ! -f "$SOURCE_SERVICE_FILE" ]; then
+    echo "Error: Source action daemon service file not found at $SOURCE_SERVICE_FILE!" 1>&2
+    exit 1
+fi
+echo "Installing the action daemon service file..."
+cp "$SOURCE_SERVICE_FILE" "$SERVICE_FILE"
+
+# Reload systemd to recognize the new service
+echo "Reloading systemd daemon..."
+systemctl daemon-reload
+
+# Enable and start the service
+echo "Enabling action daemon service to start on boot..."
+systemctl enable actions_daemon.service
+
+echo "Starting the action daemon service..."
+systemctl start actions_daemon.service
+
+echo "Checking the status of the action daemon service..."
+systemctl status actions_daemon.service --no-pager
+
+echo "-----------------------------------------"
+echo "MAVSDK Action Daemon Service installation complete!"
+echo "-----------------------------------------"